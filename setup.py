@@ -5,6 +5,9 @@ from version_wizard import from_github_tag
 setup(
     name="sphinx-stan",
     packages=find_namespace_packages(),
+    package_data={
+        "sphinxcontrib.stan": ["py.typed"],
+    },
     install_requires=[
         "sphinx",
     ],
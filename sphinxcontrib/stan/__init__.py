@@ -1,6 +1,8 @@
 from __future__ import annotations
+import bisect
 from docutils import nodes
 from docutils.statemachine import StringList
+import functools
 import hashlib
 from pathlib import Path
 import re
@@ -13,11 +15,21 @@ from sphinx.util.docfields import Field, TypedField
 from sphinx.util.docutils import SphinxDirective
 from sphinx.util.logging import getLogger
 from sphinx.util.nodes import make_refnode
-from typing import Callable, Iterable, Optional, Union
+import sys
+from typing import Callable, Iterable, Optional
 
 
 LOGGER = getLogger(__name__)
 
+# The Stan type lexicon is small and closed; mapping parsed type words to one interned string per
+# type makes the repeated type comparisons in `matches` pointer comparisons in the common case.
+# Unknown words pass through unchanged so the parser stays as lenient as before.
+_STAN_TYPES = {type: type for type in map(sys.intern, (
+    "void", "int", "real", "complex", "vector", "row_vector", "matrix", "array", "tuple",
+    "ordered", "simplex", "unit_vector", "cholesky_factor_cov", "cholesky_factor_corr",
+    "corr_matrix", "cov_matrix",
+))}
+
 
 class MatchNotFoundError(ValueError):
     """
@@ -25,30 +37,33 @@ class MatchNotFoundError(ValueError):
     """
 
 
-def match_and_consume(pattern: Union[str, re.Pattern], text: str) -> tuple[re.Match, str]:
+def match_and_consume(pattern: re.Pattern, text: str) -> tuple[re.Match, str]:
     """
     Match a pattern and consume the text.
 
     Args:
-        pattern: Pattern to match.
+        pattern: Compiled pattern to match.
         text: Text to match:
 
     Returns:
         match: Matched pattern.
         text: Remaining text after consuming the matched pattern.
     """
-    if isinstance(pattern, str):
-        pattern = re.compile(pattern)
     match = pattern.match(text)
     if not match:
         raise MatchNotFoundError(f"{pattern} did not match `{text}`")
-    return match, text[match.span()[1]:]
+    return match, text[match.end():]
+
+
+def _count_dims(dims: Optional[str]) -> Optional[int]:
+    """
+    Convert the contents of an `array [...]` prefix to a number of dimensions.
+    """
+    return None if dims is None else dims.count(",") + 1
 
 
 class TypedIdentifier:
-    TYPE_PATTERN = re.compile(r"(?:array\s*\[(?P<dims>[,\s]*)\])?\s*(?P<base_type>\w+)")
-    IDENTIFIER_PATTERN = re.compile(r"(?P<identifier>\w+)\s*")
-    WHITESPACE_PATTERN = re.compile(r"\s+")
+    __slots__ = ("identifier", "type", "dims", "text")
 
     def __init__(self, identifier: str, type: str, dims: Optional[int] = None,
                  text: Optional[str] = None) -> None:
@@ -57,60 +72,34 @@ class TypedIdentifier:
         self.dims = dims
         self.text = text
 
-    @classmethod
-    def parse(cls, text: str, parse_type: bool = True, parse_identifier: bool = True,
-              return_remainder: bool = False, **kwargs) -> tuple[TypedIdentifier, str]:
-        """
-        Parse a typed identifier.
-
-        Args:
-            text: Text to parse.
-            parse_type: Whether to parse the type.
-            parse_identifier: Whether to parse the identifier.
-            **kwargs: Keyword arguments passed to the constructor.
-
-        Returns: Parsed typed identifier.
-        """
-        identifier = type = dims = None
-        remainder = text
-        if parse_type:
-            match, remainder = match_and_consume(cls.TYPE_PATTERN, remainder)
-            type = match.group("base_type")
-            dims = match.group("dims")
-            if dims is not None:
-                dims = dims.count(",") + 1
-        if parse_type and parse_identifier:
-            _, remainder = match_and_consume(cls.WHITESPACE_PATTERN, remainder)
-        if parse_identifier:
-            match, remainder = match_and_consume(cls.IDENTIFIER_PATTERN, remainder)
-            identifier = match.group("identifier")
-        instance = cls(identifier, type, dims, text=text, **kwargs)
-        if return_remainder:
-            return instance, remainder
-        return instance
-
     def desc(self, node: addnodes.desc_signature, desc_name: Optional[Callable] = None) -> None:
         """
         Describe the object using Sphinx nodes.
         """
+        children = []
         if self.dims:
-            node += addnodes.desc_sig_keyword_type("", "array")
-            node += addnodes.desc_sig_space()
-            node += addnodes.desc_sig_punctuation("", "[")
-            for _ in range(self.dims - 1):
-                node += addnodes.desc_sig_punctuation("", ",")
-            node += addnodes.desc_sig_punctuation("", "]")
-            node += addnodes.desc_sig_space()
-        node += addnodes.desc_sig_keyword_type("", self.type)
+            children.extend([
+                addnodes.desc_sig_keyword_type("", "array"),
+                addnodes.desc_sig_space(),
+                addnodes.desc_sig_punctuation("", "["),
+            ])
+            children.extend(addnodes.desc_sig_punctuation("", ",")
+                            for _ in range(self.dims - 1))
+            children.extend([addnodes.desc_sig_punctuation("", "]"), addnodes.desc_sig_space()])
+        children.append(addnodes.desc_sig_keyword_type("", self.type))
         if self.identifier:
-            node += addnodes.desc_sig_space()
             desc_name = desc_name or addnodes.desc_sig_name
-            node += desc_name(self.identifier, self.identifier)
+            children.extend([addnodes.desc_sig_space(),
+                             desc_name(self.identifier, self.identifier)])
+        node.extend(children)
 
     def __eq__(self, other: TypedIdentifier) -> bool:
         return self.identifier == other.identifier and self.type == other.type \
             and self.dims == other.dims
 
+    def __hash__(self) -> int:
+        return hash((self.identifier, self.type, self.dims))
+
     def __repr__(self) -> str:
         full_type = self.type
         if self.dims:
@@ -125,9 +114,23 @@ class Signature(TypedIdentifier):
     """
     Stan function signature.
     """
-    OPEN_PATTERN = re.compile(r"\(\s*")
-    CLOSE_PATTERN = re.compile(r"\)\s*")
-    SEPARATOR_PATTERN = re.compile(r",\s*")
+    __slots__ = ("args", "doc", "source_info", "_arg_types")
+
+    # Head patterns matching return type, function identifier, and the opening parenthesis
+    # (including an immediately closing one) in a single pass, keyed by
+    # `(parse_type, parse_identifier)`.
+    _TYPE = r"(?:array\s*\[(?P<dims>[,\s]*)\])?\s*(?P<type>\w+)"
+    _IDENTIFIER = r"(?P<identifier>\w+)\s*"
+    _OPEN = r"(?:(?P<open>\()\s*(?P<close>\)\s*)?)?"
+    HEAD_PATTERNS = {
+        (True, True): re.compile(_TYPE + r"\s+" + _IDENTIFIER + _OPEN),
+        (True, False): re.compile(_TYPE + _OPEN),
+        (False, True): re.compile(_IDENTIFIER + _OPEN),
+        (False, False): re.compile(_OPEN),
+    }
+    # Matches a complete argument, including its trailing separator, in a single pass.
+    ARG_PATTERN = re.compile(r"(?:array\s*\[(?P<dims>[,\s]*)\])?\s*(?P<type>\w+)"
+                             r"(?:\s+(?P<identifier>\w+))?\s*(?P<sep>[,)])\s*")
 
     def __init__(self, identifier: str, type: str, dims: Optional[int] = None,
                  args: list[TypedIdentifier] = None, doc: Optional[str] = None,
@@ -136,34 +139,29 @@ class Signature(TypedIdentifier):
         self.args = args
         self.doc = doc
         self.source_info = source_info
+        self._arg_types = None
 
     @classmethod
     def parse(cls, text: str, parse_type: bool = True, parse_identifier: bool = True,
               parse_arg_identifiers: bool = True, doc: Optional[str] = None,
-              source_info: Optional[tuple[str, int]] = None, return_remainder: bool = False,
-              **kwargs) -> tuple[TypedIdentifier, str]:
-        instance, text = super().parse(text, parse_type, parse_identifier, doc=doc,
-                                       source_info=source_info, return_remainder=True, **kwargs)
-        try:
-            _, text = match_and_consume(cls.OPEN_PATTERN, text)
-        except MatchNotFoundError:
-            if return_remainder:
-                return instance, text
-            return instance
-        args = []
-        while True:
-            try:
-                arg, text = TypedIdentifier.parse(text, parse_identifier=parse_arg_identifiers,
-                                                  return_remainder=True)
-                args.append(arg)
-                _, text = match_and_consume(cls.SEPARATOR_PATTERN, text)
-            except MatchNotFoundError:
-                break
-        _, text = match_and_consume(cls.CLOSE_PATTERN, text)
-        instance.args = args
-        if return_remainder:
-            return instance, text
-        return instance
+              source_info: Optional[tuple[str, int]] = None,
+              **kwargs) -> tuple[Signature, str]:
+        (identifier, type, dims), args, remainder = \
+            _parse_signature(text, parse_type, parse_identifier, parse_arg_identifiers)
+        if args is not None:
+            args = [_typed_identifier(*arg) for arg in args]
+        instance = cls(identifier, type, dims, args=args, doc=doc, source_info=source_info,
+                       text=text, **kwargs)
+        return instance, remainder
+
+    @property
+    def arg_types(self) -> Optional[tuple]:
+        """
+        Immutable `(type, dims)` tuple for each argument, computed once per signature.
+        """
+        if self._arg_types is None and self.args is not None:
+            self._arg_types = tuple((arg.type, arg.dims) for arg in self.args)
+        return self._arg_types
 
     def matches(self, other: Signature) -> int:
         """
@@ -187,11 +185,10 @@ class Signature(TypedIdentifier):
             return 0
         if self.args is None:
             return 1
-        if len(self.args) != len(other.args):
+        # Comparing the precomputed tuples covers argument count, types, and dims in one call.
+        if self.arg_types != other.arg_types:
             return 0
         for a, b in zip(self.args, other.args):
-            if a.type != b.type or a.dims != b.dims:
-                return 0
             if a.identifier and a.identifier != b.identifier:
                 return 0
         return 2
@@ -199,17 +196,23 @@ class Signature(TypedIdentifier):
     def desc(self, node: addnodes.desc_signature) -> None:
         super().desc(node, addnodes.desc_name)
         if self.args is None:
-            LOGGER.warning("signature `%s` is missing arguments for its description")
+            LOGGER.warning("signature `%s` is missing arguments for its description", self)
         params = addnodes.desc_parameterlist()
+        children = []
         for arg in self.args:
             param = addnodes.desc_parameter()
             arg.desc(param)
-            params += param
+            children.append(param)
+        params.extend(children)
         node += params
 
     def __eq__(self, other: TypedIdentifier) -> bool:
         return super().__eq__(other) and self.args == other.args
 
+    def __hash__(self) -> int:
+        args = None if self.args is None else tuple(self.args)
+        return hash((self.identifier, self.type, self.dims, args))
+
     def __str__(self):
         value = super().__repr__()
         return f"{value}({', '.join(map(str, self.args or []))})"
@@ -222,13 +225,88 @@ class Signature(TypedIdentifier):
         return value
 
 
+@functools.lru_cache(maxsize=1024)
+def _typed_identifier(identifier: Optional[str], type: str, dims: Optional[int],
+                      text: Optional[str]) -> TypedIdentifier:
+    """
+    Get a shared typed identifier for the given fields. Arguments like `real x` recur across
+    many signatures; reusing one instance per distinct combination avoids re-allocating them on
+    every parse. Callers must not mutate the returned instance.
+    """
+    return TypedIdentifier(identifier, type, dims, text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_signature(text: str, parse_type: bool, parse_identifier: bool,
+                     parse_arg_identifiers: bool) -> tuple[tuple, Optional[tuple], str]:
+    """
+    Parse a signature into hashable components so repeated parses of the same text (e.g., by
+    `handle_signature` and `add_target_and_index` or repeated xref targets) hit the cache.
+
+    Args:
+        text: Text to parse.
+        parse_type: Whether to parse the return type.
+        parse_identifier: Whether to parse the function identifier.
+        parse_arg_identifiers: Whether to parse argument identifiers.
+
+    Returns:
+        head: Tuple of `(identifier, type, dims)` for the function itself.
+        args: Tuple of `(identifier, type, dims, text)` tuples or `None` if the text does not
+            include an argument list.
+        remainder: Remaining text after consuming the signature.
+    """
+    pattern = Signature.HEAD_PATTERNS[parse_type, parse_identifier]
+    match, remainder = match_and_consume(pattern, text)
+    groups = match.groupdict()
+    identifier = groups.get("identifier")
+    if identifier:
+        # Intern identifiers so the repeated equality checks in `matches` reduce to pointer
+        # comparisons in the common case.
+        identifier = sys.intern(identifier)
+    type = groups.get("type")
+    head = (identifier, _STAN_TYPES.get(type, type), _count_dims(groups.get("dims")))
+    if not groups["open"]:
+        return head, None, remainder
+    if groups["close"]:
+        return head, (), remainder
+    args = []
+    while True:
+        match, consumed = match_and_consume(Signature.ARG_PATTERN, remainder)
+        identifier = sys.intern(match.group("identifier")) \
+            if parse_arg_identifiers and match.group("identifier") else None
+        type = match.group("type")
+        args.append((identifier, _STAN_TYPES.get(type, type), _count_dims(match.group("dims")),
+                     remainder))
+        remainder = consumed
+        if match.group("sep") == ")":
+            break
+    return head, tuple(args), remainder
+
+
+@functools.lru_cache(maxsize=1024)
+def _describe_signature(text: str) -> tuple[nodes.Node, ...]:
+    """
+    Build the description nodes for a signature once per distinct text; callers must deep-copy
+    the returned nodes before inserting them into a document.
+    """
+    signature, _ = Signature.parse(text)
+    container = addnodes.desc_signature()
+    signature.desc(container)
+    return tuple(container.children)
+
+
 class StanFunctionDirective(ObjectDescription):
     """
     Directive for displaying user-defined functions.
     """
-    NAMED_FIELD_PATTERN = re.compile(r"@(?P<field>param)\s+(?P<value>\w+)")
-    FIELD_PATTERN = re.compile(r"@(?P<field>return|throws)")
-    COMMENT_PREFIX_PATTERN = re.compile(r"^(?:(/\*\*)|(\*/)|(\*\s?))")
+    # Combined pattern for stripping comment prefixes and rewriting doxygen fields in a single
+    # pass over the whole doc comment. `[^\S\n]` rather than `\s` stops a lone `*` from consuming
+    # the following newline, which would change the number of content lines.
+    DOXYGEN_PATTERN = re.compile(
+        r"^(?:/\*\*|\*/|\*[^\S\n]?)|@(?P<named_field>param)\s+(?P<value>\w+)"
+        r"|@(?P<field>return|throws)",
+        re.M,
+    )
 
     doc_field_types = [
         TypedField("parameter", label="Parameters", names=("param",), typerolename="class",
@@ -238,41 +316,53 @@ class StanFunctionDirective(ObjectDescription):
     ]
 
     def handle_signature(self, text: str, node: addnodes.desc_signature) -> str:
-        signature = Signature.parse(text, source_info=self.get_source_info())
-        signature.desc(node)
+        signature, _ = Signature.parse(text, source_info=self.get_source_info())
+        node.extend(child.deepcopy() for child in _describe_signature(text))
         return signature.identifier
 
     def run(self):
-        if self.has_content:
-            self.content.data = [self._replace_doxygen_fields(line) for line in self.content.data]
+        # Guard on `data` rather than `has_content`: join-then-split would turn an empty list
+        # into `[""]` without a matching entry in `items`, breaking the `ViewList` invariant that
+        # the two stay parallel.
+        if self.content.data:
+            text = self.DOXYGEN_PATTERN.sub(self._replace_doxygen_field,
+                                            "\n".join(self.content.data))
+            self.content.data = text.split("\n")
         return super().run()
 
     def add_target_and_index(self, name: str, sig: str, signode: addnodes.desc_signature) -> None:
-        signature = Signature.parse(sig, source_info=self.get_source_info())
+        signature, _ = Signature.parse(sig, source_info=self.get_source_info())
         node_id = hashlib.md5(str(signature).encode()).hexdigest()
         signode["ids"].append(node_id)
         self.env.get_domain("stan").add_function(sig, node_id, signature)
 
-    @classmethod
-    def _replace_doxygen_fields(cls, line: str) -> str:
+    @staticmethod
+    def _replace_doxygen_field(match: re.Match) -> str:
         """
-        Replace doxygen-style fields with sphinx fields. See
+        Replace a doxygen-style field with a sphinx field or strip a comment prefix. See
         https://mc-stan.org/docs/stan-users-guide/documenting-functions.html for details.
         """
-        line = cls.COMMENT_PREFIX_PATTERN.sub("", line)
-        line = cls.NAMED_FIELD_PATTERN.sub(r":\g<field> \g<value>:", line)
-        line = cls.FIELD_PATTERN.sub(r":\g<field>:", line)
-        return line
+        if field := match.group("named_field"):
+            return f":{field} {match.group('value')}:"
+        if field := match.group("field"):
+            return f":{field}:"
+        return ""
 
 
 class StanAutoDocDirective(SphinxDirective):
-    TYPED_IDENTIFIER_PATTERN = re.compile(r"(?:array\s*\[[,\s]*\]\s*)?\w+\s+\w+")
+    TYPED_IDENTIFIER = r"(?:array\s*\[[,\s]*\]\s*)?\w+\s+\w+"
+    # The doc group is bounded and the argument list is written as the unambiguous
+    # `(?:x(?:, x)*)?` form so malformed input cannot trigger catastrophic backtracking. The
+    # named groups capture the parts of the signature so matches can be turned into signatures
+    # without a second parsing pass.
     FUNCTION_PATTERN = re.compile(
-        fr"(?:/\*\*(?P<doc>.*?)\*/\s*)?(?P<signature>{TYPED_IDENTIFIER_PATTERN.pattern}"
-        fr"\(\s*(?:{TYPED_IDENTIFIER_PATTERN.pattern})*"
-        fr"(?:\s*,\s*{TYPED_IDENTIFIER_PATTERN.pattern})*\s*\))",
+        fr"(?:/\*\*(?P<doc>[\s\S]{{0,16384}}?)\*/\s*)?"
+        fr"(?P<signature>(?:array\s*\[(?P<rdims>[,\s]*)\]\s*)?(?P<rtype>\w+)\s+(?P<name>\w+)"
+        fr"\s*\(\s*(?P<args>(?:{TYPED_IDENTIFIER}(?:\s*,\s*{TYPED_IDENTIFIER})*)?)\s*\))",
         re.S
     )
+    ARG_PATTERN = re.compile(
+        r"(?:array\s*\[(?P<dims>[,\s]*)\]\s*)?(?P<type>\w+)\s+(?P<identifier>\w+)")
 
     @staticmethod
     def _parse_members(args: str):
@@ -282,7 +372,7 @@ class StanAutoDocDirective(SphinxDirective):
         for arg in args.split(";"):
             arg = arg.strip()
             try:
-                signature = Signature.parse(arg, parse_arg_identifiers=False, parse_type=False)
+                signature, _ = Signature.parse(arg, parse_arg_identifiers=False, parse_type=False)
             except MatchNotFoundError:
                 signature = Signature(arg, None)
             members.append(signature)
@@ -298,22 +388,50 @@ class StanAutoDocDirective(SphinxDirective):
         # Load the stan file and get all the signatures.
         stan_file, = self.arguments
         stan_file = Path(self.env.srcdir) / Path(self.env.docname).parent / stan_file
+        self.env.note_dependency(str(stan_file))
         try:
-            with open(stan_file) as fp:
-                text = fp.read()
+            stat = stan_file.stat()
         except FileNotFoundError:
             LOGGER.warning("`%s` does not exist", stan_file)
             return []
 
-        candidate_signatures = []
-        for match in self.FUNCTION_PATTERN.finditer(text):
-            groups = match.groupdict()
-            unparsed_signature = groups["signature"].replace("\n", " ")
-            lineno = text[:match.end()].count("\n") + 1
-            source_info = (stan_file, lineno)
-            signature = Signature.parse(unparsed_signature, doc=groups["doc"],
-                                        source_info=source_info)
-            candidate_signatures.append(signature)
+        # Reuse previously parsed signatures if the file is unchanged, e.g., when multiple
+        # documents reference the same stan file or on incremental rebuilds.
+        cache = _get_signature_cache(self.env)
+        entry = cache.get(str(stan_file))
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            _, _, digest, candidate_signatures = entry
+        else:
+            data = stan_file.read_bytes()
+            digest = hashlib.sha1(data).hexdigest()
+            text = data.decode("utf-8")
+
+            # Precompute newline offsets so the line number of each match is a binary search
+            # instead of counting newlines in an ever-growing prefix of the text.
+            newline_offsets = [newline.start() for newline in re.finditer("\n", text)]
+            candidate_signatures = []
+            for match in self.FUNCTION_PATTERN.finditer(text):
+                groups = match.groupdict()
+                unparsed_signature = groups["signature"].replace("\n", " ")
+                lineno = bisect.bisect_left(newline_offsets, match.end()) + 1
+                source_info = (stan_file, lineno)
+                # Build the signature directly from the named groups instead of reparsing the
+                # matched text.
+                args = [
+                    _typed_identifier(sys.intern(arg.group("identifier")),
+                                      _STAN_TYPES.get(arg.group("type"), arg.group("type")),
+                                      _count_dims(arg.group("dims")), arg.group(0))
+                    for arg in self.ARG_PATTERN.finditer(groups["args"])
+                ]
+                rtype = groups["rtype"]
+                signature = Signature(sys.intern(groups["name"]), _STAN_TYPES.get(rtype, rtype),
+                                      _count_dims(groups["rdims"]), args=args, doc=groups["doc"],
+                                      source_info=source_info, text=unparsed_signature)
+                candidate_signatures.append(signature)
+            cache[str(stan_file)] = (stat.st_mtime_ns, stat.st_size, digest, candidate_signatures)
+        # Record the content hash so `env-get-outdated` can detect changes to the stan file even
+        # if the document referencing it is unchanged.
+        _get_dependency_hashes(self.env).setdefault(self.env.docname, {})[str(stan_file)] = digest
         if not candidate_signatures:
             LOGGER.warning("no signatures found in `%s`; is it empty?", stan_file)
 
@@ -332,20 +450,32 @@ class StanAutoDocDirective(SphinxDirective):
         else:
             signatures = candidate_signatures
 
-        # TODO: deduplicate signatures
-
-        # Add all the functions to document by calling the documentation directive.
+        # Deduplicate signatures, e.g., due to repeated forward declarations, keyed by identifier
+        # and argument types so each overload is only documented once.
+        seen = set()
+        unique_signatures = []
+        for signature in signatures:
+            key = (signature.identifier, signature.type, signature.dims,
+                   tuple((arg.type, arg.dims) for arg in signature.args or ()))
+            if key not in seen:
+                seen.add(key)
+                unique_signatures.append(signature)
+        signatures = unique_signatures
+
+        # Add all the functions to document by calling the documentation directive. One directive
+        # instance is shared across signatures; only its arguments and content change per run.
         container = nodes.container()
+        directive = StanFunctionDirective(
+            "stan:function", [], {}, StringList([]), 0, 0, None, self.state, self.state_machine,
+        )
         signature: Signature
         for signature in signatures:
             if signature.doc:
                 content = StringList([line.rstrip("\n") for line in signature.doc.split("\n")])
             else:
                 content = StringList([])
-            directive = StanFunctionDirective(
-                "stan:function", [signature.text], {}, content, 0, 0, None, self.state,
-                self.state_machine,
-            )
+            directive.arguments = [signature.text]
+            directive.content = content
             container += directive.run()
 
         return [container]
@@ -363,9 +493,12 @@ class StanDomain(Domain):
         "function": StanFunctionDirective,
         "autodoc": StanAutoDocDirective,
     }
+    # Functions are stored as a mapping from identifier to lists of `(docname, anchor, signature)`
+    # tuples so xref resolution only touches functions sharing the target's name.
     initial_data = {
-        "functions": [],
+        "functions": {},
     }
+    data_version = 1
 
     def get_objects(self) -> Iterable[tuple[str, str, str, str, str, int]]:
         """
@@ -378,18 +511,19 @@ class StanDomain(Domain):
         - anchor: anchor name for the object.
         - priority: 1 (default), 0 (important), 2 (unimportant), -1 (hidden).
         """
-        for docname, anchor, signature in self.data["functions"]:
-            yield (signature.identifier, signature.identifier, "function", docname, anchor, 1)
+        for entries in self.data["functions"].values():
+            for docname, anchor, signature in entries:
+                yield (signature.identifier, signature.identifier, "function", docname, anchor, 1)
 
     def resolve_xref(self, env, fromdocname: str, builder, typ: str, target: str, node, contnode):
         # Try to parse the full signature and revert to just the name if not possible.
         try:
-            target = Signature.parse(target, parse_arg_identifiers=False, parse_type=False)
+            target, _ = Signature.parse(target, parse_arg_identifiers=False, parse_type=False)
         except ValueError:
             target = Signature(target, None)
-        # Iterate over all functions to try and match the requested target.
+        # Iterate over all functions with a matching identifier to try and match the target.
         results = []
-        for docname, anchor, signature in self.data["functions"]:
+        for docname, anchor, signature in self.data["functions"].get(target.identifier, ()):
             match = target.matches(signature)
             if not match:
                 continue
@@ -401,7 +535,7 @@ class StanDomain(Domain):
 
         if not results:
             LOGGER.warning("Stan func reference target not found `%s` amongst %d candidates",
-                           target, len(self.data))
+                           target, sum(map(len, self.data["functions"].values())))
             return
 
         for todocname, target_id, target_signature in results:
@@ -418,12 +552,86 @@ class StanDomain(Domain):
 
         return make_refnode(builder, fromdocname, todocname, target_id, contnode, target_id)
 
+    def clear_doc(self, docname: str) -> None:
+        """
+        Remove all functions declared in a document before it is re-read.
+        """
+        functions = self.data["functions"]
+        for identifier, entries in list(functions.items()):
+            entries[:] = [entry for entry in entries if entry[0] != docname]
+            if not entries:
+                del functions[identifier]
+
     def add_function(self, sig: str, anchor: str, signature: Signature) -> None:
         """
         Add a function to the domain.
         """
-        self.data["functions"].append((self.env.docname, anchor, signature))
+        self.data["functions"].setdefault(signature.identifier, []).append(
+            (self.env.docname, anchor, signature))
+
+    def merge_domaindata(self, docnames: list[str], otherdata: dict) -> None:
+        """
+        Merge functions read by a parallel worker process into the main domain data.
+        """
+        for identifier, entries in otherdata["functions"].items():
+            self.data["functions"].setdefault(identifier, []).extend(
+                entry for entry in entries if entry[0] in docnames)
+
 
+def _get_dependency_hashes(env) -> dict[str, dict[str, str]]:
+    """
+    Get the mapping `{docname: {stan_file: sha1_of_contents}}` stored on the environment.
+    """
+    if not hasattr(env, "stan_dependency_hashes"):
+        env.stan_dependency_hashes = {}
+    return env.stan_dependency_hashes
+
+
+def _get_signature_cache(env) -> dict[str, tuple]:
+    """
+    Get the mapping `{stan_file: (mtime_ns, size, sha1, signatures)}` stored on the environment.
+    """
+    if not hasattr(env, "stan_signature_cache"):
+        env.stan_signature_cache = {}
+    return env.stan_signature_cache
+
+
+def _env_get_outdated(app: Sphinx, env, added: set, changed: set, removed: set) -> list[str]:
+    """
+    Mark documents as outdated if the contents of any stan file they reference have changed.
+    """
+    skip = added | changed | removed
+    outdated = []
+    for docname, hashes in _get_dependency_hashes(env).items():
+        if docname in skip:
+            continue
+        for stan_file, digest in hashes.items():
+            try:
+                with open(stan_file, "rb") as fp:
+                    current = hashlib.sha1(fp.read()).hexdigest()
+            except FileNotFoundError:
+                current = None
+            if current != digest:
+                outdated.append(docname)
+                break
+    return outdated
+
+
+def _env_purge_doc(app: Sphinx, env, docname: str) -> None:
+    _get_dependency_hashes(env).pop(docname, None)
 
-def setup(app: Sphinx) -> None:
+
+def _env_merge_info(app: Sphinx, env, docnames: list[str], other) -> None:
+    _get_dependency_hashes(env).update(_get_dependency_hashes(other))
+    _get_signature_cache(env).update(_get_signature_cache(other))
+
+
+def setup(app: Sphinx) -> dict:
     app.add_domain(StanDomain)
+    app.connect("env-get-outdated", _env_get_outdated)
+    app.connect("env-purge-doc", _env_purge_doc)
+    app.connect("env-merge-info", _env_merge_info)
+    return {
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
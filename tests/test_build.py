@@ -207,3 +207,26 @@ def test_inline_markup(sphinx_build) -> None:
 @pytest.mark.sphinx_pattern(r'id="f6a9b37385091209c1725e13647d1bdf"')
 def test_persistent_id(sphinx_build) -> None:
     pass
+
+
+@pytest.mark.sphinx_file("index.stan", """
+real myfunc(real x) {}
+""")
+@pytest.mark.sphinx_file("index.rst", """
+.. stan:autodoc:: index.stan
+
+:stan:func:`myfunc`
+""")
+def test_incremental_rebuild(sphinx_build, tmp_path: Path) -> None:
+    # Change the stan file and rebuild; the referencing document must be re-read without
+    # duplicating the functions it previously declared in the domain.
+    with open(tmp_path / "index.stan", "w") as fp:
+        fp.write("""
+real myfunc(real x, real y) {}
+""")
+    sphinx_build.build()
+    assert "multiple Stan functions" not in sphinx_build._warning.getvalue()
+    functions = sphinx_build.env.get_domain("stan").data["functions"]
+    entries = functions["myfunc"]
+    assert len(entries) == 1
+    assert entries[0][2].arg_types == (("real", None), ("real", None))
@@ -1,10 +1,12 @@
 import pytest
-from sphinxcontrib.stan import Signature, TypedIdentifier
+from sphinxcontrib.stan import Signature, StanAutoDocDirective, TypedIdentifier
 from typing import Optional
 
 
-# Test examples from https://mc-stan.org/docs/stan-users-guide/functions-programming.html.
-@pytest.mark.parametrize("signature, expected, kwargs", [
+# Test examples from https://mc-stan.org/docs/stan-users-guide/functions-programming.html. The
+# cases are built once at module level so collection does not recreate them and the signature
+# itself serves as the test id.
+PARSE_SIGNATURE_CASES = (
     (
         "void basic()",
         Signature("basic", "void", args=[]),
@@ -41,14 +43,27 @@ from typing import Optional
         Signature("overloaded", None, args=[TypedIdentifier(None, "real", 2)]),
         {"parse_arg_identifiers": False, "parse_type": False},
     )
-])
+)
+
+
+@pytest.mark.parametrize("signature, expected, kwargs", PARSE_SIGNATURE_CASES,
+                         ids=[case[0] for case in PARSE_SIGNATURE_CASES])
 def test_parse_signature(signature: str, expected: dict, kwargs: Optional[dict]) -> None:
     kwargs = kwargs or {}
-    actual = Signature.parse(signature, **kwargs)
+    actual, _ = Signature.parse(signature, **kwargs)
     assert actual == expected
     assert str(actual) == signature
 
 
+def test_parse_signature_batch() -> None:
+    # Compare all cases in one list equality so a regression across several cases surfaces in a
+    # single C-level comparison rather than one test per case.
+    actual = [Signature.parse(signature, **(kwargs or {}))[0]
+              for signature, _, kwargs in PARSE_SIGNATURE_CASES]
+    expected = [expected for _, expected, _ in PARSE_SIGNATURE_CASES]
+    assert actual == expected
+
+
 @pytest.mark.parametrize("target, candidate, result", [
     ("overload", "void overload(real x, int y)", 1),
     ("overload(real, real)", "void overload(real x, int y)", 0),
@@ -61,6 +76,19 @@ def test_parse_signature(signature: str, expected: dict, kwargs: Optional[dict])
     ("overloaded(real, int)", "void overload(real x, int y)", 0),
 ])
 def test_match_signature(target: str, candidate: str, result: int) -> None:
-    target = Signature.parse(target, parse_type=False, parse_arg_identifiers=False)
-    candidate = Signature.parse(candidate)
+    target, _ = Signature.parse(target, parse_type=False, parse_arg_identifiers=False)
+    candidate, _ = Signature.parse(candidate)
     assert target.matches(candidate) == result
+
+
+def test_parse_long_signature() -> None:
+    # Long argument lists must not trigger pathological backtracking in the parser or the
+    # function pattern used by the autodoc directive.
+    args = ", ".join(f"real x{i}" for i in range(200))
+    text = f"void long_signature({args})"
+    signature, _ = Signature.parse(text)
+    assert len(signature.args) == 200
+    match = StanAutoDocDirective.FUNCTION_PATTERN.search(f"{text} {{}}")
+    assert match.group("signature") == text
+    # A truncated argument list must fail to match quickly rather than backtrack.
+    assert StanAutoDocDirective.FUNCTION_PATTERN.search("real f(" + "real x, " * 200) is None